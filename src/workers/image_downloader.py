@@ -1,7 +1,8 @@
+import asyncio
 import os
 import aiofiles
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from src.common.base import Worker, T_JobParams, NoChildJob
 from src.common.db import AsyncDatabaseSession
@@ -11,13 +12,33 @@ from src.common.logger import Logger
 from src.common.config import config
 
 
+def _create_directory(path: Path) -> None:
+    """Create a directory and any missing parents, ignoring existing ones."""
+    path.mkdir(parents=True, exist_ok=True)
+
+
+def _create_http_client() -> AsyncHttpClient:
+    """Create the HTTP client used for a single image download."""
+    return AsyncHttpClient(retries=3, delay=2)
+
+
 class ImageDownloader(Worker):
     """Worker for downloading images from TMDB."""
 
     TMDB_IMAGE_BASE_URL: str = "https://image.tmdb.org/t/p/original"
+    DOWNLOAD_CHUNK_SIZE: int = 64 * 1024
+    MAX_CONCURRENT_DOWNLOADS: int = 4
+
+    # Shared by every instance, since the job manager creates a worker per job
+    _download_semaphore: Optional[asyncio.Semaphore] = None
+    _download_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def __init__(
-        self, db_session: AsyncDatabaseSession, logger: Optional[Logger] = None
+        self,
+        db_session: AsyncDatabaseSession,
+        logger: Optional[Logger] = None,
+        dir_factory: Callable[[Path], None] = _create_directory,
+        http_client_factory: Callable[[], AsyncHttpClient] = _create_http_client,
     ) -> None:
         """
         Initialize the image downloader worker.
@@ -25,12 +46,29 @@ class ImageDownloader(Worker):
         Args:
             db_session: Database session for database operations
             logger: Optional logger instance
+            dir_factory: Callable that creates the directory an image is saved in
+            http_client_factory: Callable that creates an HTTP client per download
         """
         super().__init__(db_session, logger)
-        self.http_client = AsyncHttpClient(
-            retries=3,
-            delay=2,
-        )
+        self.dir_factory = dir_factory
+        self.http_client_factory = http_client_factory
+
+    @classmethod
+    def _get_download_semaphore(cls) -> asyncio.Semaphore:
+        """
+        Get the semaphore capping downloads across all image downloader jobs.
+
+        The semaphore is created lazily, and again whenever the running event
+        loop changes, because a semaphore can only be used on a single loop.
+
+        Returns:
+            asyncio.Semaphore: The semaphore shared by all instances
+        """
+        loop = asyncio.get_running_loop()
+        if cls._download_semaphore is None or cls._download_semaphore_loop is not loop:
+            cls._download_semaphore = asyncio.Semaphore(cls.MAX_CONCURRENT_DOWNLOADS)
+            cls._download_semaphore_loop = loop
+        return cls._download_semaphore
 
     async def execute(self, parameters: Optional[T_JobParams] = None) -> NoChildJob:
         """
@@ -72,13 +110,15 @@ class ImageDownloader(Worker):
         image_path = entity_dir / image_filename
 
         # Create the directory if it doesn't exist
-        os.makedirs(entity_dir, exist_ok=True)
+        self.dir_factory(entity_dir)
 
         if self.logger:
             self.logger.info(f"Downloading image from {full_image_url} to {image_path}")
 
-        # Download and save the image
-        success = await self._download_image(full_image_url, image_path)
+        # Download and save the image, capping concurrent requests across all
+        # jobs to avoid TMDB rate limits
+        async with self._get_download_semaphore():
+            success = await self._download_image(full_image_url, image_path)
 
         if success:
             if self.logger:
@@ -100,29 +140,40 @@ class ImageDownloader(Worker):
         Returns:
             bool: True if download was successful, False otherwise
         """
-        async with self.http_client:
-            response = await self.http_client.fetch_data(url)
+        # Use a client per download, since concurrent downloads would otherwise
+        # replace and close each other's session
+        async with self.http_client_factory() as http_client:
+            response = await http_client.fetch_data(url)
 
             if response is None:
                 if self.logger:
                     self.logger.error(f"Failed to download image from {url}")
                 return False
 
+            # Write to a temporary file first so a failed download never leaves
+            # a truncated image at the final path
+            partial_path = path.with_name(f"{path.name}.part")
+
             try:
-                # Read the image data
-                image_data = await response.read()
+                # Stream the body in chunks so memory use doesn't grow with image size
+                chunks = response.content.iter_chunked(self.DOWNLOAD_CHUNK_SIZE)
+                first_chunk = await anext(chunks, b"")
 
-                if not image_data:
+                if not first_chunk:
                     if self.logger:
                         self.logger.error(f"Empty image data received from {url}")
                     return False
 
-                # Save the image to the specified path
-                async with aiofiles.open(path, "wb") as f:
-                    await f.write(image_data)
+                # Save the image, then move it into place once it is complete
+                async with aiofiles.open(partial_path, "wb") as f:
+                    await f.write(first_chunk)
+                    async for chunk in chunks:
+                        await f.write(chunk)
+                partial_path.replace(path)
 
                 return True
             except Exception as e:
+                partial_path.unlink(missing_ok=True)
                 if self.logger:
                     self.logger.error(f"Error saving image: {e}")
                 return False
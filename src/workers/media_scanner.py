@@ -1,11 +1,11 @@
-from typing import Optional
+from typing import Iterable, Optional
+import asyncio
 import uuid
 
 from sqlalchemy import select, Result
 from src.common.dto import FileDTO, FileMatcherParams, MediaScannerParams
 from src.workers.base import T_JobParams, Worker
 from src.common.dto import ChildJobRequest, JobType
-import aiofiles
 import aiofiles.os
 import hashlib
 import os
@@ -14,6 +14,24 @@ from src.common.db import AsyncDatabaseSession
 from src.common.logger import Logger
 
 
+def _sync_md5(file_path: str, chunk_size: int) -> str:
+    """
+    Calculate the MD5 hash of a file with blocking IO
+
+    Args:
+        file_path: Path to the file
+        chunk_size: Size of chunks to read from file
+
+    Returns:
+        Hexadecimal string representation of the MD5 hash
+    """
+    md5_hash = hashlib.md5()
+    with open(file_path, "rb") as file:
+        while chunk := file.read(chunk_size):
+            md5_hash.update(chunk)
+    return md5_hash.hexdigest()
+
+
 class MediaScanner(Worker):
     """Media scanning worker implementation."""
 
@@ -116,14 +134,18 @@ class MediaScanner(Worker):
         Update the database with the indexed files
         """
         async for session in self.db_session.get_session():
-            for file in files:
-                # add to file table
-                file_model: File = File(**file.model_dump())
-                session.add(file_model)
+            # add to file table in one batch rather than one unit-of-work call per row
+            file_models: list[File] = [File(**file.model_dump()) for file in files]
+            session.add_all(file_models)
 
-    async def _calculate_md5(self, file_path: str, chunk_size: int = 4096) -> str:
+    async def _calculate_md5(
+        self, file_path: str, chunk_size: int = 1024 * 1024
+    ) -> str:
         """
-        Calculate MD5 hash of a file using async IO operations
+        Calculate MD5 hash of a file without blocking the event loop
+
+        The whole file is hashed in a single worker thread rather than awaiting
+        one thread hop per chunk; hashlib releases the GIL while hashing.
 
         Args:
             file_path: Path to the file
@@ -137,41 +159,36 @@ class MediaScanner(Worker):
             PermissionError: If the file cannot be accessed
             IOError: For other IO-related errors
         """
-        md5_hash = hashlib.md5()
-
         # Check if file exists and is accessible
         if not await aiofiles.os.path.exists(file_path):
             raise FileNotFoundError(f"File does not exist: {file_path}")
 
-        # Open file in binary mode for reading
-        async with aiofiles.open(file_path, "rb") as file:
-            # Read and update hash in chunks
-            while chunk := await file.read(chunk_size):
-                md5_hash.update(chunk)
-
-        # Return the hexadecimal representation of the hash
-        return md5_hash.hexdigest()
+        return await asyncio.to_thread(_sync_md5, file_path, chunk_size)
 
     async def _scan_directory(
-        self, directory_path: str, file_extensions: list[str]
+        self, directory_path: str, file_extensions: Iterable[str]
     ) -> list[str]:
         """
         Scan a directory for files with specified extensions
 
         Args:
             directory_path: Path to scan
-            file_extensions: List of file extensions to look for
+            file_extensions: File extensions to look for (any iterable)
             logger: Optional logger for debug information
 
         Returns:
             List of file paths that match the criteria
         """
         matching_files: list[str] = []
-        lowercase_extensions: set[str] = {ext.lower() for ext in file_extensions}
+        # Build the lookup set once so each file is an O(1) membership test
+        lowercase_extensions: frozenset[str] = frozenset(
+            ext.lower() for ext in file_extensions
+        )
 
         if self.logger:
             self.logger.debug(
-                f"Scanning {directory_path} for files with extensions: {file_extensions}"
+                f"Scanning {directory_path} for files with extensions: "
+                f"{sorted(lowercase_extensions)}"
             )
 
         # Verify directory exists
@@ -187,7 +204,7 @@ class MediaScanner(Worker):
                 file_ext = os.path.splitext(filename)[1].lower()
 
                 # Check if this file has a matching extension
-                if not file_extensions or file_ext in lowercase_extensions:
+                if not lowercase_extensions or file_ext in lowercase_extensions:
                     full_path = os.path.join(root, filename)
                     matching_files.append(full_path)
                     if self.logger:
@@ -1,6 +1,15 @@
 """
 Test configuration for pytest.
 This file ensures that the src directory is in the Python path for tests.
+
+Full runs (and CI) use pytest-xdist, distributing tests by module so each
+module's tests share one worker:
+    pytest -n auto --dist loadfile
+
+While iterating locally, pytest-testmon reruns only the tests whose source
+dependencies changed since the last run:
+    pytest --testmon
+Full runs (and CI) should omit --testmon.
 """
 
 import os
@@ -0,0 +1,23 @@
+"""Shared helpers for tests."""
+
+from typing import Any, Callable, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+def async_const(value: T) -> Callable[..., Coroutine[Any, Any, T]]:
+    """Build an async callable that ignores its arguments and returns value.
+
+    Cheaper than an AsyncMock for stubs whose calls are never asserted on.
+
+    Args:
+        value: Value returned by every call
+
+    Returns:
+        Async function returning value
+    """
+
+    async def _const(*args: Any, **kwargs: Any) -> T:
+        return value
+
+    return _const
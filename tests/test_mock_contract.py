@@ -0,0 +1,12 @@
+"""Checks that the bare mocks used by test fixtures match the real classes."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from src.common.db import AsyncDatabaseSession
+from src.common.logger import Logger
+
+
+def test_mock_contract_is_valid() -> None:
+    """Test that the unspecced fixture mocks only stand in for real attributes."""
+    assert set(dir(MagicMock(spec=Logger))) >= {"debug", "info", "warning", "error"}
+    assert set(dir(AsyncMock(spec=AsyncDatabaseSession))) >= {"get_session"}
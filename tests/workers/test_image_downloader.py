@@ -1,56 +1,70 @@
+import asyncio
 import uuid
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Any, AsyncGenerator, cast
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    ContextManager,
+    Generator,
+    Optional,
+    cast,
+)
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import aiohttp
 import pytest
 import pytest_asyncio
+from aioresponses import aioresponses
+from yarl import URL
 
-from src.common.db import AsyncDatabaseSession
 from src.common.dto import ImageDownloaderParams
 from src.common.http_client import AsyncHttpClient
-from src.common.logger import Logger
 from src.workers.image_downloader import ImageDownloader
+from tests.helpers import async_const
 
 
-class MockResponse:
-    """Mock implementation of aiohttp.ClientResponse for testing"""
+class RecordingHttpClient(AsyncHttpClient):
+    """Real AsyncHttpClient that keeps track of the responses it hands out"""
 
-    def __init__(
+    def __init__(self) -> None:
+        super().__init__(retries=1, delay=0)
+        self.responses: list[aiohttp.ClientResponse] = []
+
+    async def fetch_data(
         self,
-        status: int = 200,
-        data: bytes = b"test_image_data",
-        raise_on_read: bool = False,
-    ):
-        self.status = status
-        self._data = data
-        self._raise_on_read = raise_on_read
-        self.closed = False
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+    ) -> Optional[aiohttp.ClientResponse]:
+        response = await super().fetch_data(endpoint, params)
+        if response is not None:
+            self.responses.append(response)
+        return response
+
 
-    async def read(self) -> bytes:
-        if self._raise_on_read:
-            raise aiohttp.ClientError("Error reading response")
-        return self._data
+def _fail_after_first_chunk(
+    reader: aiohttp.StreamReader, n: int
+) -> AsyncGenerator[bytes, None]:
+    """Stand-in for StreamReader.iter_chunked that drops the connection mid-stream."""
 
-    async def release(self) -> None:
-        self.closed = True
+    async def chunks() -> AsyncGenerator[bytes, None]:
+        yield b"partial_image_data"
+        raise aiohttp.ClientPayloadError("Connection lost mid-stream")
 
-    @property
-    def ok(self) -> bool:
-        return 200 <= self.status < 300
+    return chunks()
 
 
 @pytest_asyncio.fixture  # type: ignore
 async def mock_db_session() -> AsyncMock:
     """Fixture for a mocked database session."""
-    return AsyncMock(spec=AsyncDatabaseSession)
+    return AsyncMock()
 
 
 @pytest_asyncio.fixture  # type: ignore
 async def mock_logger() -> MagicMock:
     """Fixture for a mocked logger."""
-    return MagicMock(spec=Logger)
+    return MagicMock()
 
 
 @pytest_asyncio.fixture  # type: ignore
@@ -64,20 +78,33 @@ async def mock_http_client() -> AsyncMock:
 
 @pytest_asyncio.fixture  # type: ignore
 async def image_downloader(
-    mock_db_session: AsyncMock, mock_logger: MagicMock
-) -> AsyncGenerator[ImageDownloader, None]:
+    mock_db_session: AsyncMock,
+    mock_logger: MagicMock,
+    mock_http_client: AsyncMock,
+) -> ImageDownloader:
     """Fixture for an ImageDownloader with mocked dependencies."""
-    with patch(
-        "src.workers.image_downloader.AsyncHttpClient"
-    ) as mock_http_client_class:
-        mock_http_client = AsyncMock()
-        mock_http_client_class.return_value = mock_http_client
-        mock_http_client.__aenter__.return_value = mock_http_client
+    return ImageDownloader(
+        db_session=mock_db_session,
+        logger=mock_logger,
+        http_client_factory=lambda: mock_http_client,
+    )
+
 
-        downloader = ImageDownloader(db_session=mock_db_session, logger=mock_logger)
-        downloader.http_client = mock_http_client
+@pytest.fixture
+def recording_client(image_downloader: ImageDownloader) -> RecordingHttpClient:
+    """Fixture giving the downloader a real HTTP client that records its responses."""
+    client = RecordingHttpClient()
+    image_downloader.http_client_factory = lambda: client
+    return client
 
-        yield downloader
+
+@pytest.fixture
+def http_mock(
+    recording_client: RecordingHttpClient,
+) -> Generator[aioresponses, None, None]:
+    """Fixture routing the downloader's real HTTP client through aioresponses."""
+    with aioresponses() as mocked:
+        yield mocked
 
 
 @pytest.mark.asyncio
@@ -239,203 +266,193 @@ async def test_execute_download_failure(
 @pytest.mark.asyncio
 async def test_download_image_success(
     image_downloader: ImageDownloader,
-    mock_logger: MagicMock,
+    http_mock: aioresponses,
+    recording_client: RecordingHttpClient,
     tmp_path: Path,
 ) -> None:
     """Test _download_image method with successful download."""
     # Setup
     test_url = "https://example.com/image.jpg"
     test_path = tmp_path / "test_image.jpg"
-    test_data = b"test_image_data"
-
-    # Create mock response
-    mock_response = MockResponse(status=200, data=test_data)
-
-    # Configure the HTTP client to return the mock response
-    image_downloader.http_client.fetch_data.return_value = mock_response  # type: ignore
-
-    # Mock aiofiles.open
-    mock_file = AsyncMock()
-    mock_file_context = AsyncMock()
-    mock_file_context.__aenter__.return_value = mock_file
+    test_data = b"test_image_data" * 10_000  # Spans several download chunks
 
-    with patch("aiofiles.open", return_value=mock_file_context):
-        # Execute
-        # We're testing a protected method, but it's necessary for thorough testing
-        result = await image_downloader._download_image(test_url, test_path)  # type: ignore
-
-        # Assert
-        assert result is True
-
-        # Verify HTTP client was called
-        image_downloader.http_client.fetch_data.assert_called_once_with(test_url)  # type: ignore
-
-        # Verify file was written
-        mock_file.write.assert_called_once_with(test_data)
-
-        # Verify response was released
-        assert mock_response.closed is True
-
-
-@pytest.mark.asyncio
-async def test_download_image_http_failure(
-    image_downloader: ImageDownloader,
-    mock_logger: MagicMock,
-) -> None:
-    """Test _download_image method when HTTP request fails."""
-    # Setup
-    test_url = "https://example.com/image.jpg"
-    test_path = Path("/tmp/test_image.jpg")
-
-    # Configure the HTTP client to return None (request failed)
-    image_downloader.http_client.fetch_data.return_value = None  # type: ignore
+    http_mock.get(test_url, status=200, body=test_data)
 
     # Execute
     # We're testing a protected method, but it's necessary for thorough testing
     result = await image_downloader._download_image(test_url, test_path)  # type: ignore
 
     # Assert
-    assert result is False
+    assert result is True
 
     # Verify HTTP client was called
-    image_downloader.http_client.fetch_data.assert_called_once_with(test_url)  # type: ignore
-
-    # Verify logger error was called
-    mock_logger.error.assert_called_once_with(
-        f"Failed to download image from {test_url}"
-    )
+    assert len(http_mock.requests[("GET", URL(test_url))]) == 1
 
-
-@pytest.mark.asyncio
-async def test_download_image_empty_data(
-    image_downloader: ImageDownloader,
-    mock_logger: MagicMock,
-) -> None:
-    """Test _download_image method when response contains empty data."""
-    # Setup
-    test_url = "https://example.com/image.jpg"
-    test_path = Path("/tmp/test_image.jpg")
-
-    # Create mock response with empty data
-    mock_response = MockResponse(status=200, data=b"")
-
-    # Configure the HTTP client to return the mock response
-    image_downloader.http_client.fetch_data.return_value = mock_response  # type: ignore
-
-    # Execute
-    # We're testing a protected method, but it's necessary for thorough testing
-    result = await image_downloader._download_image(test_url, test_path)  # type: ignore
-
-    # Assert
-    assert result is False
-
-    # Verify HTTP client was called
-    image_downloader.http_client.fetch_data.assert_called_once_with(test_url)  # type: ignore
-
-    # Verify logger error was called
-    mock_logger.error.assert_called_once_with(
-        f"Empty image data received from {test_url}"
-    )
+    # Verify file was written
+    assert test_path.read_bytes() == test_data
 
     # Verify response was released
-    assert mock_response.closed is True
+    assert all(response.closed for response in recording_client.responses)
 
 
 @pytest.mark.asyncio
-async def test_download_image_read_exception(
+@pytest.mark.parametrize(
+    "status, body, failure_patch, expected_error, expected_responses",
+    [
+        (404, b"", nullcontext, "Failed to download image from {url}", 0),
+        (200, b"", nullcontext, "Empty image data received from {url}", 1),
+        (
+            200,
+            b"test_image_data",
+            lambda: patch.object(
+                aiohttp.StreamReader,
+                "iter_chunked",
+                side_effect=aiohttp.ClientPayloadError("Error reading response"),
+            ),
+            None,
+            1,
+        ),
+        (
+            200,
+            b"test_image_data",
+            lambda: patch.object(
+                aiohttp.StreamReader, "iter_chunked", _fail_after_first_chunk
+            ),
+            None,
+            1,
+        ),
+        (
+            200,
+            b"test_image_data",
+            lambda: patch("aiofiles.open", side_effect=IOError("Failed to open file")),
+            None,
+            1,
+        ),
+    ],
+    ids=[
+        "http_failure",
+        "empty_data",
+        "read_exception",
+        "mid_stream_read_exception",
+        "write_exception",
+    ],
+)
+async def test_download_image_failure(
     image_downloader: ImageDownloader,
+    http_mock: aioresponses,
+    recording_client: RecordingHttpClient,
     mock_logger: MagicMock,
+    tmp_path: Path,
+    status: int,
+    body: bytes,
+    failure_patch: Callable[[], ContextManager[Any]],
+    expected_error: Optional[str],
+    expected_responses: int,
 ) -> None:
-    """Test _download_image method when reading response raises an exception."""
+    """Test _download_image method failure paths."""
     # Setup
     test_url = "https://example.com/image.jpg"
-    test_path = Path("/tmp/test_image.jpg")
-
-    # Create mock response that raises on read
-    mock_response = MockResponse(status=200, raise_on_read=True)
+    test_path = tmp_path / "test_image.jpg"
 
-    # Configure the HTTP client to return the mock response
-    image_downloader.http_client.fetch_data.return_value = mock_response  # type: ignore
+    http_mock.get(test_url, status=status, body=body)
 
-    # Execute
-    # We're testing a protected method, but it's necessary for thorough testing
-    result = await image_downloader._download_image(test_url, test_path)  # type: ignore
+    with failure_patch():
+        # Execute
+        # We're testing a protected method, but it's necessary for thorough testing
+        result = await image_downloader._download_image(test_url, test_path)  # type: ignore
 
     # Assert
     assert result is False
+    assert not test_path.exists()
+    assert list(tmp_path.iterdir()) == []
 
     # Verify HTTP client was called
-    image_downloader.http_client.fetch_data.assert_called_once_with(test_url)  # type: ignore
+    assert len(http_mock.requests[("GET", URL(test_url))]) == 1
 
     # Verify logger error was called
-    mock_logger.error.assert_called_once()
+    if expected_error is None:
+        mock_logger.error.assert_called_once()
+    else:
+        mock_logger.error.assert_called_once_with(expected_error.format(url=test_url))
 
     # Verify response was released
-    assert mock_response.closed is True
+    assert len(recording_client.responses) == expected_responses
+    assert all(response.closed for response in recording_client.responses)
 
 
 @pytest.mark.asyncio
-async def test_download_image_write_exception(
+async def test_execute_creates_entity_directory(
     image_downloader: ImageDownloader,
-    mock_logger: MagicMock,
+    tmp_path: Path,
 ) -> None:
-    """Test _download_image method when writing to file raises an exception."""
+    """Test that the directory factory is called to create the entity directory."""
     # Setup
-    test_url = "https://example.com/image.jpg"
-    test_path = Path("/tmp/test_image.jpg")
-    test_data = b"test_image_data"
+    test_entity_id = uuid.uuid4()
+    test_image_url = "/path/to/image.jpg"
+    params = ImageDownloaderParams(image_url=test_image_url, entity_id=test_entity_id)
 
-    # Create mock response
-    mock_response = MockResponse(status=200, data=test_data)
+    dir_factory = Mock()
+    image_downloader.dir_factory = dir_factory
 
-    # Configure the HTTP client to return the mock response
-    image_downloader.http_client.fetch_data.return_value = mock_response  # type: ignore
+    # Stub the _download_image method to return success
+    image_downloader._download_image = async_const(True)  # type: ignore
 
-    # Mock aiofiles.open to raise an exception
-    mock_file_context = AsyncMock()
-    mock_file_context.__aenter__.side_effect = IOError("Failed to open file")
+    # Mock the config.IMAGE_DIRECTORY
+    with patch("src.workers.image_downloader.config") as mock_config:
+        mock_config.IMAGE_DIRECTORY = str(tmp_path)
 
-    with patch("aiofiles.open", return_value=mock_file_context):
         # Execute
-        # We're testing a protected method, but it's necessary for thorough testing
-        result = await image_downloader._download_image(test_url, test_path)  # type: ignore
-
-        # Assert
-        assert result is False
-
-        # Verify HTTP client was called
-        image_downloader.http_client.fetch_data.assert_called_once_with(test_url)  # type: ignore
+        await image_downloader.execute(params)
 
-        # Verify logger error was called
-        mock_logger.error.assert_called_once()
-
-        # Verify response was released
-        assert mock_response.closed is True
+    # Assert
+    expected_dir = Path(tmp_path) / str(test_entity_id)
+    dir_factory.assert_called_once_with(expected_dir)
 
 
 @pytest.mark.asyncio
-async def test_makedirs_called(
-    image_downloader: ImageDownloader,
+async def test_execute_caps_concurrent_downloads(
+    mock_db_session: AsyncMock,
     mock_logger: MagicMock,
+    mock_http_client: AsyncMock,
     tmp_path: Path,
 ) -> None:
-    """Test that os.makedirs is called to create the directory."""
-    # Setup
-    test_entity_id = uuid.uuid4()
-    test_image_url = "/path/to/image.jpg"
-    params = ImageDownloaderParams(image_url=test_image_url, entity_id=test_entity_id)
+    """Test that concurrent jobs never exceed the shared download concurrency limit."""
+    # Setup - one downloader per job, as the job manager creates them
+    jobs = [
+        (
+            ImageDownloader(
+                db_session=mock_db_session,
+                logger=mock_logger,
+                dir_factory=Mock(),
+                http_client_factory=lambda: mock_http_client,
+            ),
+            ImageDownloaderParams(
+                image_url=f"/path/to/image{i}.jpg", entity_id=uuid.uuid4()
+            ),
+        )
+        for i in range(50)
+    ]
+
+    # Instrument the HTTP client to track how many requests are in flight
+    inflight = 0
+    max_inflight = 0
+
+    async def fetch_data(url: str) -> None:
+        nonlocal inflight, max_inflight
+        inflight += 1
+        max_inflight = max(max_inflight, inflight)
+        await asyncio.sleep(0)
+        inflight -= 1
+        return None
+
+    mock_http_client.fetch_data = fetch_data
 
     # Mock the config.IMAGE_DIRECTORY
     with patch("src.workers.image_downloader.config") as mock_config:
         mock_config.IMAGE_DIRECTORY = str(tmp_path)
 
-        # Mock os.makedirs
-        with patch("os.makedirs") as mock_makedirs:
-            # Mock the _download_image method to return success
-            with patch.object(image_downloader, "_download_image", return_value=True):
-                # Execute
-                await image_downloader.execute(params)
+        # Execute
+        await asyncio.gather(*(downloader.execute(p) for downloader, p in jobs))
 
-                # Assert
-                expected_dir = Path(tmp_path) / str(test_entity_id)
-                mock_makedirs.assert_called_once_with(expected_dir, exist_ok=True)
+    # Assert
+    assert 0 < max_inflight <= ImageDownloader.MAX_CONCURRENT_DOWNLOADS
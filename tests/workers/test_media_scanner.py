@@ -1,7 +1,19 @@
+import asyncio
 import os
 import uuid
 import hashlib
-from typing import Any, AsyncGenerator, List, Optional, cast, TypeVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    cast,
+    TypeVar,
+)
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
@@ -20,13 +32,27 @@ from src.common.logger import Logger
 from src.common.models import File
 from src.common.system_types import MediaType
 from src.workers.media_scanner import MediaScanner
+from tests.helpers import async_const
 
 T = TypeVar("T")
 
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+@dataclass
+class FileStub:
+    """Duck-typed stand-in for the File columns read by MediaScanner"""
+
+    id: uuid.UUID
+    path: str
+    hash: str
+    media_type: MediaType
+
 
 class MockAsyncSession(AsyncSession):
     def __init__(self) -> None:
-        self.add_called = False
+        self.add_calls = 0
+        self.add_all_objs: Optional[List[Any]] = None
         self.execute_result: Optional[List[File]] = None
 
     async def execute(self, query: Any) -> Result[Any]:
@@ -39,7 +65,10 @@ class MockAsyncSession(AsyncSession):
         return mock_result
 
     def add(self, obj: Any) -> None:
-        self.add_called = True
+        self.add_calls += 1
+
+    def add_all(self, objs: Iterable[Any]) -> None:
+        self.add_all_objs = list(objs)
 
 
 class MockAsyncDatabaseSession(AsyncDatabaseSession):
@@ -57,7 +86,7 @@ def mock_db_session() -> MockAsyncDatabaseSession:
 
 @pytest.fixture
 def mock_logger() -> Logger:
-    return MagicMock(spec=Logger)
+    return MagicMock()
 
 
 @pytest.fixture
@@ -67,7 +96,24 @@ def media_scanner(
     return MediaScanner(mock_db_session, mock_logger)
 
 
-@pytest.mark.asyncio
+@pytest.fixture
+def stub_scanner(
+    media_scanner: MediaScanner, monkeypatch: pytest.MonkeyPatch
+) -> Callable[..., None]:
+    """Factory that replaces MediaScanner methods for the duration of a test.
+
+    Callables are installed as-is; any other value becomes the result of an async stub.
+    """
+
+    def _apply(**stubs: Any) -> None:
+        for name, value in stubs.items():
+            monkeypatch.setattr(
+                media_scanner, name, value if callable(value) else async_const(value)
+            )
+
+    return _apply
+
+
 async def test_execute_with_invalid_parameters(media_scanner: MediaScanner) -> None:
     """Test execute method with invalid parameters."""
     with pytest.raises(
@@ -76,7 +122,6 @@ async def test_execute_with_invalid_parameters(media_scanner: MediaScanner) -> N
         await media_scanner.execute(None)
 
 
-@pytest.mark.asyncio
 async def test_execute_with_no_files(media_scanner: MediaScanner) -> None:
     """Test execute method when no files are found."""
     # Mock _scan_directory to return empty list
@@ -93,60 +138,61 @@ async def test_execute_with_no_files(media_scanner: MediaScanner) -> None:
         assert len(result) == 0
 
 
-@pytest.mark.asyncio
-async def test_execute_with_new_files(media_scanner: MediaScanner) -> None:
+async def test_execute_with_new_files(
+    media_scanner: MediaScanner,
+    stub_scanner: Callable[..., None],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """Test execute method with new files found."""
     # Generate a single UUID for predictability
     test_uuid = uuid.uuid4()
 
-    with (
-        patch.object(
-            media_scanner,
-            "_scan_directory",
-            return_value=["/fake/path/file1.mp3", "/fake/path/file2.mp3"],
-        ),
-        patch.object(media_scanner, "_get_all_files", return_value=[]),
-        patch.object(media_scanner, "_calculate_md5", return_value="fakehash"),
-        patch.object(media_scanner, "_update_db", return_value=None),
-        # Use a single UUID for all calls to ensure consistent behavior
-        patch("uuid.uuid4", return_value=test_uuid),
-    ):
-        result = await media_scanner.execute(
-            MediaScannerParams(
-                dir_path="/fake/path",
-                file_extensions=[".mp3"],
-                media_type=MediaType.MUSIC,
-            )
-        )
-
-        assert isinstance(result, list)
-        assert len(result) == 4  # Two jobs per file (FILE_MATCHER and FFPROBE)
-
-        # Group jobs by file path
-        jobs_by_path: dict[str, list[ChildJobRequest]] = {}
-        for job in result:
-            path = (
-                job.params.path if hasattr(job.params, "path") else job.params.file_id
-            )
-            if path not in jobs_by_path:
-                jobs_by_path[path] = []
-            jobs_by_path[path].append(job)
-
-        # Verify we have jobs for both files
-        assert set(jobs_by_path.keys()) == {
-            "/fake/path/file1.mp3",
-            "/fake/path/file2.mp3",
-        }
-
-        # Verify each file has both types of jobs
-        for file_jobs in jobs_by_path.values():
-            assert len(file_jobs) == 2
-            job_types = {job.job_type for job in file_jobs}
-            assert job_types == {JobType.FILE_MATCHER, JobType.FFPROBE}
+    stub_scanner(
+        _scan_directory=["/fake/path/file1.mp3", "/fake/path/file2.mp3"],
+        _get_all_files=[],
+        _calculate_md5="fakehash",
+        _update_db=None,
+    )
+    # Use a single UUID for all calls to ensure consistent behavior
+    monkeypatch.setattr("uuid.uuid4", lambda: test_uuid)
 
+    result = await media_scanner.execute(
+        MediaScannerParams(
+            dir_path="/fake/path",
+            file_extensions=[".mp3"],
+            media_type=MediaType.MUSIC,
+        )
+    )
 
-@pytest.mark.asyncio
-async def test_execute_with_existing_files(media_scanner: MediaScanner) -> None:
+    assert isinstance(result, list)
+    assert len(result) == 4  # Two jobs per file (FILE_MATCHER and FFPROBE)
+
+    # Group jobs by file path
+    jobs_by_path: dict[str, list[ChildJobRequest]] = {}
+    for job in result:
+        path = job.params.path if hasattr(job.params, "path") else job.params.file_id
+        if path not in jobs_by_path:
+            jobs_by_path[path] = []
+        jobs_by_path[path].append(job)
+
+    # Verify we have jobs for both files
+    assert set(jobs_by_path.keys()) == {
+        "/fake/path/file1.mp3",
+        "/fake/path/file2.mp3",
+    }
+
+    # Verify each file has both types of jobs
+    for file_jobs in jobs_by_path.values():
+        assert len(file_jobs) == 2
+        job_types = {job.job_type for job in file_jobs}
+        assert job_types == {JobType.FILE_MATCHER, JobType.FFPROBE}
+
+
+async def test_execute_with_existing_files(
+    media_scanner: MediaScanner,
+    stub_scanner: Callable[..., None],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """Test execute method with some existing files."""
     # Generate fixed UUIDs for predictability
     existing_uuid = uuid.uuid4()
@@ -162,41 +208,78 @@ async def test_execute_with_existing_files(media_scanner: MediaScanner) -> None:
     async def mock_calculate_md5(path: str) -> str:
         return "fakehash" if path == "/fake/path/file1.mp3" else "newhash"
 
-    with (
-        patch.object(
-            media_scanner,
-            "_scan_directory",
-            return_value=["/fake/path/file1.mp3", "/fake/path/file2.mp3"],
-        ),
-        patch.object(media_scanner, "_get_all_files", return_value=[existing_file]),
-        patch.object(media_scanner, "_calculate_md5", side_effect=mock_calculate_md5),
-        patch.object(media_scanner, "_update_db", return_value=None),
-        # Use a single new UUID for consistency
-        patch("uuid.uuid4", return_value=new_uuid),
-    ):
-        result = await media_scanner.execute(
-            MediaScannerParams(
-                dir_path="/fake/path",
-                file_extensions=[".mp3"],
-                media_type=MediaType.MUSIC,
-            )
+    stub_scanner(
+        _scan_directory=["/fake/path/file1.mp3", "/fake/path/file2.mp3"],
+        _get_all_files=[existing_file],
+        _calculate_md5=mock_calculate_md5,
+        _update_db=None,
+    )
+    # Use a single new UUID for consistency
+    monkeypatch.setattr("uuid.uuid4", lambda: new_uuid)
+
+    result = await media_scanner.execute(
+        MediaScannerParams(
+            dir_path="/fake/path",
+            file_extensions=[".mp3"],
+            media_type=MediaType.MUSIC,
         )
+    )
 
-        assert isinstance(result, list)
-        assert len(result) == 2  # Two jobs for the one new file
+    assert isinstance(result, list)
+    assert len(result) == 2  # Two jobs for the one new file
+
+    # Verify both jobs are for the new file
+    for job in result:
+        if isinstance(job.params, FileMatcherParams):
+            assert job.job_type == JobType.FILE_MATCHER
+            assert job.params.path == "/fake/path/file2.mp3"
+            assert job.params.media_type == MediaType.MUSIC
+        else:  # FFProbeParams
+            assert job.job_type == JobType.FFPROBE
+            assert job.params.path == "/fake/path/file2.mp3"
+
+
+async def test_execute_with_many_existing_files(
+    media_scanner: MediaScanner, stub_scanner: Callable[..., None]
+) -> None:
+    """Test execute method only hashes new files when the library is large."""
+    existing_files = [
+        FileDTO(
+            id=uuid.uuid4(), path=f"/p/{i}.mp3", hash="h", media_type=MediaType.MUSIC
+        )
+        for i in range(1000)
+    ]
+    new_paths = [f"/p/new/{i}.mp3" for i in range(10)]
+    scanned_paths = [file.path for file in existing_files] + new_paths
+
+    hashed_paths: list[str] = []
+
+    async def counting_calculate_md5(path: str) -> str:
+        hashed_paths.append(path)
+        return "newhash"
+
+    update_db = AsyncMock(return_value=None)
+    stub_scanner(
+        _scan_directory=scanned_paths,
+        _get_all_files=existing_files,
+        _calculate_md5=counting_calculate_md5,
+        _update_db=update_db,
+    )
+
+    await media_scanner.execute(
+        MediaScannerParams(
+            dir_path="/p",
+            file_extensions=[".mp3"],
+            media_type=MediaType.MUSIC,
+        )
+    )
 
-        # Verify both jobs are for the new file
-        for job in result:
-            if isinstance(job.params, FileMatcherParams):
-                assert job.job_type == JobType.FILE_MATCHER
-                assert job.params.path == "/fake/path/file2.mp3"
-                assert job.params.media_type == MediaType.MUSIC
-            else:  # FFProbeParams
-                assert job.job_type == JobType.FFPROBE
-                assert job.params.path == "/fake/path/file2.mp3"
+    # Only files missing from the database are hashed and stored
+    assert hashed_paths == new_paths
+    stored_files: list[FileDTO] = update_db.call_args[0][0]
+    assert [file.path for file in stored_files] == new_paths
 
 
-@pytest.mark.asyncio
 async def test_get_all_files_empty(
     media_scanner: MediaScanner, mock_db_session: MockAsyncDatabaseSession
 ) -> None:
@@ -209,25 +292,25 @@ async def test_get_all_files_empty(
     assert len(result) == 0
 
 
-@pytest.mark.asyncio
 async def test_get_all_files_with_data(
     media_scanner: MediaScanner, mock_db_session: MockAsyncDatabaseSession
 ) -> None:
     """Test _get_all_files method when files exist."""
-    # Create mock File objects with real version 4 UUIDs
-    file1 = MagicMock(spec=File)
-    file1.id = uuid.uuid4()
-    file1.path = "/path/to/file1.mp3"
-    file1.hash = "hash1"
-    file1.media_type = MediaType.MUSIC
-
-    file2 = MagicMock(spec=File)
-    file2.id = uuid.uuid4()
-    file2.path = "/path/to/file2.mp3"
-    file2.hash = "hash2"
-    file2.media_type = MediaType.MUSIC
+    # Create File stand-ins with real version 4 UUIDs
+    file1 = FileStub(
+        id=uuid.uuid4(),
+        path="/path/to/file1.mp3",
+        hash="hash1",
+        media_type=MediaType.MUSIC,
+    )
+    file2 = FileStub(
+        id=uuid.uuid4(),
+        path="/path/to/file2.mp3",
+        hash="hash2",
+        media_type=MediaType.MUSIC,
+    )
 
-    mock_db_session.session.execute_result = [file1, file2]
+    mock_db_session.session.execute_result = cast(List[File], [file1, file2])
 
     result = await media_scanner._get_all_files()
     assert isinstance(result, list)
@@ -244,7 +327,6 @@ async def test_get_all_files_with_data(
     assert result[1].media_type == MediaType.MUSIC
 
 
-@pytest.mark.asyncio
 async def test_update_db(
     media_scanner: MediaScanner, mock_db_session: MockAsyncDatabaseSession
 ) -> None:
@@ -265,10 +347,17 @@ async def test_update_db(
     ]
 
     await media_scanner._update_db(files)
-    assert mock_db_session.session.add_called
+
+    # Files must be inserted in one batch, not added row by row
+    assert mock_db_session.session.add_calls == 0
+    assert mock_db_session.session.add_all_objs is not None
+    assert len(mock_db_session.session.add_all_objs) == 2
+    assert [f.path for f in mock_db_session.session.add_all_objs] == [
+        "/path/to/file1.mp3",
+        "/path/to/file2.mp3",
+    ]
 
 
-@pytest.mark.asyncio
 async def test_calculate_md5_file_not_found(media_scanner: MediaScanner) -> None:
     """Test _calculate_md5 method with non-existent file."""
     with patch("aiofiles.os.path.exists", return_value=False):
@@ -277,28 +366,37 @@ async def test_calculate_md5_file_not_found(media_scanner: MediaScanner) -> None
             await media_scanner._calculate_md5("/fake/path/nonexistent.mp3")
 
 
-@pytest.mark.asyncio
-async def test_calculate_md5_success(media_scanner: MediaScanner) -> None:
+async def test_calculate_md5_success(
+    media_scanner: MediaScanner, tmp_path: Path
+) -> None:
     """Test _calculate_md5 method with successful hash calculation."""
     test_content = b"test content"
     expected_hash = hashlib.md5(test_content).hexdigest()
+    test_file = tmp_path / "file.mp3"
+    test_file.write_bytes(test_content)
 
-    mock_file = AsyncMock()
-    mock_file.read.side_effect = [test_content, b""]  # Return content then EOF
+    # We're intentionally accessing protected method for testing
+    result = await media_scanner._calculate_md5(str(test_file), chunk_size=4)
+    assert result == expected_hash
 
-    with (
-        patch("aiofiles.os.path.exists", return_value=True),
-        patch(
-            "aiofiles.open",
-            return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_file)),
-        ),
-    ):
+
+async def test_calculate_md5_hashes_off_event_loop(
+    media_scanner: MediaScanner, tmp_path: Path
+) -> None:
+    """Test _calculate_md5 method hashes the file in a worker thread."""
+    test_content = b"test content" * 1000
+    expected_hash = hashlib.md5(test_content).hexdigest()
+    test_file = tmp_path / "large.mkv"
+    test_file.write_bytes(test_content)
+
+    with patch("asyncio.to_thread", wraps=asyncio.to_thread) as mock_to_thread:
         # We're intentionally accessing protected method for testing
-        result = await media_scanner._calculate_md5("/fake/path/file.mp3")
-        assert result == expected_hash
+        result = await media_scanner._calculate_md5(str(test_file))
+
+    assert result == expected_hash
+    mock_to_thread.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_scan_directory_not_exists(media_scanner: MediaScanner) -> None:
     """Test _scan_directory method with non-existent directory."""
     with patch("aiofiles.os.path.exists", return_value=False):
@@ -308,9 +406,15 @@ async def test_scan_directory_not_exists(media_scanner: MediaScanner) -> None:
         assert len(result) == 0
 
 
-@pytest.mark.asyncio
-async def test_scan_directory_with_matching_files(media_scanner: MediaScanner) -> None:
-    """Test _scan_directory method with matching files."""
+@pytest.mark.parametrize(
+    "extensions",
+    [[".mp3"], {".mp3"}, (".mp3",), frozenset({".MP3"})],
+    ids=["list", "set", "tuple", "uppercase_frozenset"],
+)
+async def test_scan_directory_with_matching_files(
+    media_scanner: MediaScanner, extensions: Iterable[str]
+) -> None:
+    """Test _scan_directory method with matching files for any extensions iterable."""
     mock_files = [
         ("root", [], ["file1.mp3", "file2.txt", "file3.mp3"]),
         ("root/subdir", [], ["file4.mp3", "file5.wav"]),
@@ -329,7 +433,7 @@ async def test_scan_directory_with_matching_files(media_scanner: MediaScanner) -
         patch("os.path.join", side_effect=lambda root, file: f"{root}/{file}"),
     ):
         # We're intentionally accessing protected method for testing
-        result = await media_scanner._scan_directory("/fake/path", [".mp3"])
+        result = await media_scanner._scan_directory("/fake/path", extensions)
         assert isinstance(result, list)
         assert len(result) == 3
         assert "root/file1.mp3" in result
@@ -339,7 +443,6 @@ async def test_scan_directory_with_matching_files(media_scanner: MediaScanner) -
         assert "root/subdir/file5.wav" not in result
 
 
-@pytest.mark.asyncio
 async def test_scan_directory_with_no_extensions_filter(
     media_scanner: MediaScanner,
 ) -> None:
@@ -1,7 +1,8 @@
 import pytest
-from typing import Any, cast
-from unittest.mock import AsyncMock, MagicMock, call
-from uuid import uuid4
+from dataclasses import dataclass
+from typing import Any, Generator, Optional, cast
+from unittest.mock import AsyncMock, MagicMock, call, create_autospec
+from uuid import UUID, uuid4
 
 from src.common.db import AsyncDatabaseSession
 from src.common.dto import (
@@ -18,39 +19,163 @@ from src.common.system_types import MediaType
 from src.workers.metadata_matcher import MetadataMatcher
 
 
-@pytest.fixture
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+# Autospeccing introspects the whole class, so each spec is built once per module
+_LOGGER_SPEC = create_autospec(Logger, spec_set=True, instance=True)
+_DB_SESSION_SPEC = create_autospec(AsyncDatabaseSession, spec_set=True, instance=True)
+
+# Generated once per module: tests only need the IDs to be distinct. They must
+# stay version 4 because the job parameter DTOs validate it.
+_FILE_ID = uuid4()
+_ENTITY_ID = uuid4()
+
+# Validated once at import; execute() only reads its parameters
+_MOVIE_PARAMS = MetadataMatcherParams(
+    matched_data=MatchedData(title="Test Movie", year=2020, media_type=MediaType.MOVIE),
+    file_id=_FILE_ID,
+)
+_TV_PARAMS = MetadataMatcherParams(
+    matched_data=MatchedData(
+        title="Test TV Show",
+        year=2020,
+        media_type=MediaType.TV,
+        season_number=1,
+        episode_number=1,
+    ),
+    file_id=_FILE_ID,
+)
+
+
+@dataclass
+class EntityStub:
+    """Duck-typed stand-in for the EntityDTO read by _insert_entity"""
+
+    id: Optional[UUID]
+    fields: dict[str, Any]
+
+    def model_dump(self) -> dict[str, Any]:
+        return self.fields
+
+
+@dataclass
+class ExecuteCase:
+    """Inputs and expected outcome for one execute() scenario"""
+
+    params: MetadataMatcherParams
+    search_method: Optional[str]
+    search_results: list[dict[str, Any]]
+    expected_log: Optional[tuple[str, str]]
+
+
+_EXECUTE_CASES = {
+    "movie_match": ExecuteCase(
+        params=_MOVIE_PARAMS,
+        search_method="_search_movie",
+        # Include all required fields
+        search_results=[
+            {
+                "id": 12345,
+                "title": "Test Movie",
+                "release_date": "2020-01-01",
+                "poster_path": "/path.jpg",
+            }
+        ],
+        expected_log=None,
+    ),
+    "tv_match": ExecuteCase(
+        params=_TV_PARAMS,
+        search_method="_search_tv",
+        # Include all required fields for TV shows
+        search_results=[
+            {
+                "id": 67890,
+                "name": "Test TV Show",
+                "title": "Test TV Show",
+                "release_date": "2020-01-01",
+                "poster_path": "/path.jpg",
+            }
+        ],
+        expected_log=None,
+    ),
+    "unsupported_media_type": ExecuteCase(
+        params=MetadataMatcherParams(
+            matched_data=MatchedData(
+                title="Test Media",
+                year=2020,
+                media_type=MediaType.MUSIC,  # Using valid enum value
+            ),
+            file_id=_FILE_ID,
+        ),
+        search_method=None,
+        search_results=[],
+        expected_log=("error", f"Unsupported media type: {MediaType.MUSIC}"),
+    ),
+    "no_matches": ExecuteCase(
+        params=MetadataMatcherParams(
+            matched_data=MatchedData(
+                title="Non-existent Movie", year=2020, media_type=MediaType.MOVIE
+            ),
+            file_id=_FILE_ID,
+        ),
+        search_method="_search_movie",
+        search_results=[],
+        expected_log=("info", "No matches found for Non-existent Movie"),
+    ),
+}
+
+
+@pytest.fixture(params=_EXECUTE_CASES.values(), ids=_EXECUTE_CASES.keys())
+def execute_case(request: pytest.FixtureRequest) -> ExecuteCase:
+    """Provide each execute() scenario in turn."""
+    return cast(ExecuteCase, request.param)
+
+
+@pytest.fixture(autouse=True)
 def mock_db_session() -> AsyncDatabaseSession:
-    """Create a mock database session."""
-    mock_session = MagicMock(spec=AsyncDatabaseSession)
+    """Reset the shared mock database session before each test."""
+    mock_session = _DB_SESSION_SPEC
+    mock_session.reset_mock(return_value=True, side_effect=True)
     session_context = AsyncMock()
     mock_session.get_session.return_value.__aiter__.return_value = [session_context]
     return mock_session
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_logger() -> Logger:
-    """Create a mock logger."""
-    return MagicMock(spec=Logger)
+    """Create a mock logger shared by every test in the module."""
+    return _LOGGER_SPEC
+
 
+@pytest.fixture(scope="module")
+def metadata_matcher(mock_logger: Logger) -> MetadataMatcher:
+    """Create a MetadataMatcher shared by every test in the module.
 
-@pytest.fixture
-def metadata_matcher(
-    mock_db_session: AsyncDatabaseSession, mock_logger: Logger
-) -> MetadataMatcher:
-    """Create a MetadataMatcher instance with mocked dependencies."""
-    return MetadataMatcher(db_session=mock_db_session, logger=mock_logger)
+    Tests replace its attributes with monkeypatch so they are restored afterwards.
+    """
+    return MetadataMatcher(db_session=_DB_SESSION_SPEC, logger=mock_logger)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_http_client() -> AsyncMock:
-    """Create a mock HTTP client."""
+    """Create a mock HTTP client shared by every test in the module."""
     mock_client = AsyncMock()
     mock_client.__aenter__.return_value = mock_client
     mock_client.__aexit__.return_value = None
     return mock_client
 
 
-@pytest.mark.asyncio
+@pytest.fixture(autouse=True)
+def reset_shared_mocks(
+    mock_logger: MagicMock, mock_http_client: AsyncMock
+) -> Generator[None, None, None]:
+    """Clear recorded calls on the module-scoped mocks after each test."""
+    yield
+    mock_logger.reset_mock()
+    mock_http_client.reset_mock()
+
+
 async def test_execute_invalid_parameters(metadata_matcher: MetadataMatcher) -> None:
     """Test that execute raises ValueError when parameters are not of the correct type."""
     with pytest.raises(
@@ -59,161 +184,58 @@ async def test_execute_invalid_parameters(metadata_matcher: MetadataMatcher) ->
         await metadata_matcher.execute(cast(Any, {"invalid": "params"}))
 
 
-@pytest.mark.asyncio
-async def test_execute_movie_match(metadata_matcher: MetadataMatcher) -> None:
-    """Test that execute handles movie matches correctly."""
-    # Update mock results to include all required fields
-    mock_results = [
-        {
-            "id": 12345,
-            "title": "Test Movie",
-            "release_date": "2020-01-01",
-            "poster_path": "/path.jpg",
-        }
-    ]
-    # Use monkeypatch to avoid accessing protected method directly
-    setattr(metadata_matcher, "_search_movie", AsyncMock(return_value=mock_results))
-    setattr(metadata_matcher, "_insert_media_search_result", AsyncMock())
-
-    test_uuid = uuid4()
-    params = MetadataMatcherParams(
-        matched_data=MatchedData(
-            title="Test Movie", year=2020, media_type=MediaType.MOVIE
-        ),
-        file_id=test_uuid,
-    )
-
-    await metadata_matcher.execute(params)
-
-    # Verify the search_movie method was called with the correct parameters
-    search_movie = getattr(metadata_matcher, "_search_movie")
-    search_movie.assert_called_once_with(params.matched_data)
-
-    # Verify _insert_media_search_result was called
-    insert_media = getattr(metadata_matcher, "_insert_media_search_result")
-    assert insert_media.called
-
-
-@pytest.mark.asyncio
-async def test_execute_tv_match(metadata_matcher: MetadataMatcher) -> None:
-    """Test that execute handles TV show matches correctly."""
-    # Update mock results to include all required fields for TV shows
-    mock_results = [
-        {
-            "id": 67890,
-            "name": "Test TV Show",
-            "title": "Test TV Show",
-            "release_date": "2020-01-01",
-            "poster_path": "/path.jpg",
-        }
-    ]
-    setattr(metadata_matcher, "_search_tv", AsyncMock(return_value=mock_results))
-    setattr(metadata_matcher, "_insert_media_search_result", AsyncMock())
-
-    test_uuid = uuid4()
-    params = MetadataMatcherParams(
-        matched_data=MatchedData(
-            title="Test TV Show",
-            year=2020,
-            media_type=MediaType.TV,
-            season_number=1,
-            episode_number=1,
-        ),
-        file_id=test_uuid,
-    )
-
-    await metadata_matcher.execute(params)
-
-    # Verify the search_tv method was called with the correct parameters
-    search_tv = getattr(metadata_matcher, "_search_tv")
-    search_tv.assert_called_once_with(params.matched_data)
-
-    # Verify _insert_media_search_result was called
-    insert_media = getattr(metadata_matcher, "_insert_media_search_result")
-    assert insert_media.called
-
-
-@pytest.mark.asyncio
-async def test_execute_unsupported_media_type(
+async def test_execute(
     metadata_matcher: MetadataMatcher,
+    execute_case: ExecuteCase,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """Test that execute handles unsupported media types correctly."""
-    test_uuid = uuid4()
-    params = MetadataMatcherParams(
-        matched_data=MatchedData(
-            title="Test Media",
-            year=2020,
-            media_type=MediaType.MUSIC,  # Using valid enum value
-        ),
-        file_id=test_uuid,
-    )
+    """Test that execute searches, stores matches and logs for each media type."""
+    # Use monkeypatch to avoid accessing protected methods directly
+    if execute_case.search_method is not None:
+        monkeypatch.setattr(
+            metadata_matcher,
+            execute_case.search_method,
+            AsyncMock(return_value=execute_case.search_results),
+        )
+    if execute_case.search_results:
+        monkeypatch.setattr(
+            metadata_matcher, "_insert_media_search_result", AsyncMock()
+        )
+
+    await metadata_matcher.execute(execute_case.params)
+
+    # Verify the search method was called with the correct parameters
+    if execute_case.search_method is not None:
+        search = getattr(metadata_matcher, execute_case.search_method)
+        search.assert_called_once_with(execute_case.params.matched_data)
 
-    await metadata_matcher.execute(params)
-
-    # Verify logger.error was called with the expected message
-    assert metadata_matcher.logger is not None
-    metadata_matcher.logger.error.assert_called_once_with(
-        f"Unsupported media type: {MediaType.MUSIC}"
-    )
-
-
-@pytest.mark.asyncio
-async def test_execute_no_matches(metadata_matcher: MetadataMatcher) -> None:
-    """Test that execute handles no matches correctly."""
-    setattr(metadata_matcher, "_search_movie", AsyncMock(return_value=[]))
-
-    test_uuid = uuid4()
-    params = MetadataMatcherParams(
-        matched_data=MatchedData(
-            title="Non-existent Movie", year=2020, media_type=MediaType.MOVIE
-        ),
-        file_id=test_uuid,
-    )
-
-    await metadata_matcher.execute(params)
+    # Verify _insert_media_search_result was called
+    if execute_case.search_results:
+        insert_media = getattr(metadata_matcher, "_insert_media_search_result")
+        assert insert_media.called
 
-    # Verify logger.info was called with the expected message
-    assert metadata_matcher.logger is not None
-    metadata_matcher.logger.info.assert_called_once_with(
-        "No matches found for Non-existent Movie"
-    )
+    # Verify the logger was called with the expected message
+    if execute_case.expected_log is not None:
+        level, message = execute_case.expected_log
+        assert metadata_matcher.logger is not None
+        getattr(metadata_matcher.logger, level).assert_called_once_with(message)
 
 
-@pytest.mark.asyncio
+@pytest.mark.parametrize("year", [2020, None], ids=["with_year", "no_year"])
 async def test_search_movie(
-    metadata_matcher: MetadataMatcher, mock_http_client: AsyncMock
+    metadata_matcher: MetadataMatcher,
+    mock_http_client: AsyncMock,
+    monkeypatch: pytest.MonkeyPatch,
+    year: Optional[int],
 ) -> None:
-    """Test the _search_movie method."""
+    """Test the _search_movie method with and without a year."""
     # We're testing a protected method directly, but it's a test so it's acceptable
-    metadata_matcher.http_client = mock_http_client
-    mock_response = {"results": [{"id": 12345, "title": "Test Movie"}]}
-    mock_http_client.fetch_json.return_value = mock_response
-
-    matched_data = MatchedData(
-        title="Test Movie", year=2020, media_type=MediaType.MOVIE
-    )
-
-    # Mock the call with proper params
-    mock_http_client.fetch_json.call_args = None
-    mock_http_client.fetch_json.return_value = mock_response
-
-    result = await metadata_matcher._search_movie(matched_data)  # type: ignore
-
-    assert result == mock_response["results"]
-    mock_http_client.fetch_json.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_search_movie_no_year(
-    metadata_matcher: MetadataMatcher, mock_http_client: AsyncMock
-) -> None:
-    """Test the _search_movie method without a year."""
-    metadata_matcher.http_client = mock_http_client
+    monkeypatch.setattr(metadata_matcher, "http_client", mock_http_client)
     mock_response = {"results": [{"id": 12345, "title": "Test Movie"}]}
     mock_http_client.fetch_json.return_value = mock_response
 
     matched_data = MatchedData(
-        title="Test Movie", year=None, media_type=MediaType.MOVIE
+        title="Test Movie", year=year, media_type=MediaType.MOVIE
     )
 
     result = await metadata_matcher._search_movie(matched_data)  # type: ignore
@@ -222,42 +244,38 @@ async def test_search_movie_no_year(
     mock_http_client.fetch_json.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_search_tv(
-    metadata_matcher: MetadataMatcher, mock_http_client: AsyncMock
+    metadata_matcher: MetadataMatcher,
+    mock_http_client: AsyncMock,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test the _search_tv method."""
-    metadata_matcher.http_client = mock_http_client
+    monkeypatch.setattr(metadata_matcher, "http_client", mock_http_client)
     mock_response = {"results": [{"id": 67890, "name": "Test TV Show"}]}
     mock_http_client.fetch_json.return_value = mock_response
 
-    matched_data = MatchedData(title="Test TV Show", year=2020, media_type=MediaType.TV)
-
-    result = await metadata_matcher._search_tv(matched_data)
+    result = await metadata_matcher._search_tv(_TV_PARAMS.matched_data)
 
     assert result == mock_response["results"]
     mock_http_client.fetch_json.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_insert_entity(metadata_matcher: MetadataMatcher) -> None:
     """Test the _insert_entity method."""
-    test_uuid = uuid4()
-    file_uuid = uuid4()
-
     # Create mock entity with valid Entity model fields
-    entity = MagicMock()
-    entity.id = test_uuid
-    entity.model_dump.return_value = {
-        "id": test_uuid,
-        "file_id": file_uuid,
-        "entity_type": EntityType.MOVIE,  # Using EntityType instead of MediaType
-        "metadata_status": MetadataStatus.PENDING,  # Required field with default
-        "matched_data": {"tmdb_id": 12345},  # Store external ID in matched_data
-    }
-
-    result = await metadata_matcher._insert_entity(entity)
-    assert result == test_uuid
+    entity = EntityStub(
+        id=_ENTITY_ID,
+        fields={
+            "id": _ENTITY_ID,
+            "file_id": _FILE_ID,
+            "entity_type": EntityType.MOVIE,  # Using EntityType instead of MediaType
+            "metadata_status": MetadataStatus.PENDING,  # Required field with default
+            "matched_data": {"tmdb_id": 12345},  # Store external ID in matched_data
+        },
+    )
+
+    result = await metadata_matcher._insert_entity(cast(Any, entity))
+    assert result == _ENTITY_ID
 
     session = (
         metadata_matcher.db_session.get_session.return_value.__aiter__.return_value[0]
@@ -266,18 +284,17 @@ async def test_insert_entity(metadata_matcher: MetadataMatcher) -> None:
     session.flush.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_insert_entity_no_id(metadata_matcher: MetadataMatcher) -> None:
     """Test the _insert_entity method when no ID is generated."""
-    file_uuid = uuid4()
-    entity = MagicMock()
-    entity.id = None
-    entity.model_dump.return_value = {
-        "file_id": file_uuid,
-        "entity_type": EntityType.MOVIE,  # Using EntityType instead of MediaType
-        "metadata_status": MetadataStatus.PENDING,  # Required field with default
-        "matched_data": {"tmdb_id": 12345},  # Store external ID in matched_data
-    }
+    entity = EntityStub(
+        id=None,
+        fields={
+            "file_id": _FILE_ID,
+            "entity_type": EntityType.MOVIE,  # Using EntityType instead of MediaType
+            "metadata_status": MetadataStatus.PENDING,  # Required field with default
+            "matched_data": {"tmdb_id": 12345},  # Store external ID in matched_data
+        },
+    )
 
     with pytest.raises(ValueError, match="Failed to generate entity ID"):
-        await metadata_matcher._insert_entity(entity)
+        await metadata_matcher._insert_entity(cast(Any, entity))
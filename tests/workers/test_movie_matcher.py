@@ -1,7 +1,8 @@
 from datetime import date
-from typing import Any, AsyncGenerator, Dict, cast
+from types import MappingProxyType
+from typing import Any, Dict, Generator, Mapping, Optional, cast
 import uuid
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, create_autospec, patch
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,43 +16,19 @@ from src.common.system_types import EntityType, MetadataStatus
 from src.workers.movie_matcher import MovieMatcher
 
 
-@pytest.fixture
-def mock_db_session() -> tuple[AsyncMock, AsyncMock]:
-    """Create a mock database session."""
-    session = AsyncMock(spec=AsyncDatabaseSession)
-
-    # Create mock session that will be returned by the context manager
-    db_session = AsyncMock(spec=AsyncSession)
-
-    # Mock the async context manager
-    async def async_session_context() -> AsyncGenerator[AsyncSession, None]:
-        yield db_session
-
-    # Set up the session factory to return our context manager
-    session.get_session.return_value = async_session_context()
-
-    return session, db_session
-
-
-@pytest.fixture
-def mock_logger() -> MagicMock:
-    """Create a mock logger."""
-    return MagicMock(spec=Logger)
-
-
-@pytest.fixture
-def movie_matcher(
-    mock_db_session: tuple[AsyncMock, AsyncMock], mock_logger: MagicMock
-) -> MovieMatcher:
-    """Create a MovieMatcher instance with mocked dependencies."""
-    session, _ = mock_db_session
-    return MovieMatcher(session, mock_logger)
+# Autospeccing introspects the whole class, so each spec is built once per module
+# and reset before every test that uses it
+_LOGGER_SPEC = create_autospec(Logger, spec_set=True, instance=True)
+_DB_SESSION_SPEC = create_autospec(AsyncDatabaseSession, spec_set=True, instance=True)
+_SESSION_SPEC = create_autospec(AsyncSession, spec_set=True, instance=True)
+_HTTP_CLIENT_SPEC = create_autospec(AsyncHttpClient, spec_set=True, instance=True)
 
+# Generated once per module: tests only need the ID to be distinct
+_FILE_ID = uuid.uuid4()
+_MOVIE_PARAMS = MovieMatcherParams(tmdb_id=123, file_id=_FILE_ID)
 
-@pytest.fixture
-def mock_tmdb_data() -> Dict[str, Any]:
-    """Mock TMDB API response data."""
-    return {
+_TMDB_MOVIE_DATA: Mapping[str, Any] = MappingProxyType(
+    {
         "id": 123,
         "title": "Test Movie",
         "overview": "A test movie description",
@@ -63,34 +40,88 @@ def mock_tmdb_data() -> Dict[str, Any]:
         "videos": {"results": [{"key": "trailer_id", "site": "YouTube"}]},
         "images": {"backdrops": [], "posters": []},
     }
+)
 
 
-@pytest.fixture
-def mock_params() -> MovieMatcherParams:
-    """Create mock parameters for the movie matcher."""
-    return MovieMatcherParams(tmdb_id=123, file_id=uuid.uuid4())
+class _SessionCtx:
+    """One-shot async iterator standing in for AsyncDatabaseSession.get_session()."""
+
+    def __init__(self, session: MagicMock) -> None:
+        self.session: Optional[MagicMock] = session
+
+    def __aiter__(self) -> "_SessionCtx":
+        return self
+
+    async def __anext__(self) -> MagicMock:
+        if self.session is None:
+            raise StopAsyncIteration
+        session, self.session = self.session, None
+        return session
+
+
+@pytest.fixture(autouse=True)
+def mock_db_session() -> tuple[MagicMock, MagicMock]:
+    """Reset the shared mock database session before each test."""
+    session = _DB_SESSION_SPEC
+    session.reset_mock(return_value=True, side_effect=True)
+
+    # Create mock session that will be returned by the context manager
+    db_session = _SESSION_SPEC
+    db_session.reset_mock(return_value=True, side_effect=True)
+
+    # Set up the session factory to yield our session once
+    session.get_session.return_value = _SessionCtx(db_session)
+
+    return session, db_session
+
+
+@pytest.fixture(scope="module")
+def mock_logger() -> MagicMock:
+    """Create a mock logger shared by every test in the module."""
+    return _LOGGER_SPEC
+
+
+@pytest.fixture(autouse=True)
+def reset_mock_logger(mock_logger: MagicMock) -> Generator[None, None, None]:
+    """Clear recorded calls on the module-scoped logger after each test."""
+    yield
+    mock_logger.reset_mock()
+
+
+@pytest.fixture(scope="module")
+def movie_matcher(mock_logger: MagicMock) -> MovieMatcher:
+    """Create a MovieMatcher shared by every test in the module.
+
+    Tests replace its attributes with monkeypatch so they are restored afterwards.
+    """
+    return MovieMatcher(_DB_SESSION_SPEC, mock_logger)
+
+
+@pytest.fixture(scope="session")
+def mock_tmdb_data() -> Mapping[str, Any]:
+    """Mock TMDB API response data.
+
+    Read-only and shared by every test, so tests must copy it before mutating.
+    """
+    return _TMDB_MOVIE_DATA
 
 
 @pytest.fixture
-def movie_matcher_with_test_access(
-    mock_db_session: tuple[AsyncMock, AsyncMock], mock_logger: MagicMock
-) -> MovieMatcher:
-    """Create a MovieMatcher instance with test-access to protected methods."""
-    session, _ = mock_db_session
-    matcher = MovieMatcher(session, mock_logger)
+def http_client_mock() -> MagicMock:
+    """Create a mock HTTP client that returns itself as its context manager."""
+    http_client = _HTTP_CLIENT_SPEC
+    http_client.reset_mock(return_value=True, side_effect=True)
+    http_client.__aenter__.return_value = http_client
+    return http_client
 
-    # Expose protected methods for testing
-    # This is a common pattern for testing protected methods
-    matcher.fetch_movie_details = matcher._fetch_movie_details  # type: ignore
-    matcher.insert_movie = matcher._insert_movie  # type: ignore
-    matcher.insert_entity = matcher._insert_entity  # type: ignore
-    matcher.create_movie_dto = matcher._create_movie_dto  # type: ignore
-    matcher.find_pending_entity = matcher._find_pending_entity  # type: ignore
 
-    return matcher
+@pytest.fixture(scope="session")
+def mock_params() -> MovieMatcherParams:
+    """Mock parameters for the movie matcher, validated once at import."""
+    return _MOVIE_PARAMS
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_execute_invalid_parameters(movie_matcher: MovieMatcher) -> None:
     """Test execute method with invalid parameters."""
     # Call with invalid parameters
@@ -100,13 +131,17 @@ async def test_execute_invalid_parameters(movie_matcher: MovieMatcher) -> None:
         await movie_matcher.execute({})  # type: ignore
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_execute_fetch_details_failure(
-    movie_matcher: MovieMatcher, mock_params: MovieMatcherParams
+    movie_matcher: MovieMatcher,
+    mock_params: MovieMatcherParams,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test execute method when fetch_movie_details fails."""
     # Mock the dependencies
-    movie_matcher._fetch_movie_details = AsyncMock(return_value={})
+    monkeypatch.setattr(
+        movie_matcher, "_fetch_movie_details", AsyncMock(return_value={})
+    )
 
     # Call the method
     result = await movie_matcher.execute(mock_params)
@@ -118,16 +153,19 @@ async def test_execute_fetch_details_failure(
     mock_logger.error.assert_called_once()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_execute_insert_movie_failure(
     movie_matcher: MovieMatcher,
     mock_params: MovieMatcherParams,
-    mock_tmdb_data: Dict[str, Any],
+    mock_tmdb_data: Mapping[str, Any],
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test execute method when insert_movie fails."""
     # Mock the dependencies
-    movie_matcher._fetch_movie_details = AsyncMock(return_value=mock_tmdb_data)
-    movie_matcher._insert_movie = AsyncMock(return_value=None)
+    monkeypatch.setattr(
+        movie_matcher, "_fetch_movie_details", AsyncMock(return_value=mock_tmdb_data)
+    )
+    monkeypatch.setattr(movie_matcher, "_insert_movie", AsyncMock(return_value=None))
 
     # Call the method
     result = await movie_matcher.execute(mock_params)
@@ -140,15 +178,15 @@ async def test_execute_insert_movie_failure(
     mock_logger.error.assert_called_once()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_fetch_movie_details_success(
-    movie_matcher: MovieMatcher, mock_tmdb_data: Dict[str, Any]
+    movie_matcher: MovieMatcher,
+    mock_tmdb_data: Mapping[str, Any],
+    http_client_mock: MagicMock,
 ) -> None:
     """Test _fetch_movie_details method success case."""
     # Mock HTTP client
-    http_client_mock = AsyncMock(spec=AsyncHttpClient)
-    http_client_mock.__aenter__.return_value = http_client_mock
-    http_client_mock.fetch_json = AsyncMock(return_value=mock_tmdb_data)
+    http_client_mock.fetch_json.return_value = mock_tmdb_data
 
     with patch.object(movie_matcher, "http_client", http_client_mock):
         result = await movie_matcher._fetch_movie_details(123)
@@ -161,13 +199,13 @@ async def test_fetch_movie_details_success(
     assert "append_to_response" in params_call
 
 
-@pytest.mark.asyncio
-async def test_fetch_movie_details_failure(movie_matcher: MovieMatcher) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_fetch_movie_details_failure(
+    movie_matcher: MovieMatcher, http_client_mock: MagicMock
+) -> None:
     """Test _fetch_movie_details method when API call fails."""
     # Mock HTTP client to raise exception
-    http_client_mock = AsyncMock(spec=AsyncHttpClient)
-    http_client_mock.__aenter__.return_value = http_client_mock
-    http_client_mock.fetch_json = AsyncMock(side_effect=Exception("API error"))
+    http_client_mock.fetch_json.side_effect = Exception("API error")
 
     with patch.object(movie_matcher, "http_client", http_client_mock):
         result = await movie_matcher._fetch_movie_details(123)
@@ -179,13 +217,13 @@ async def test_fetch_movie_details_failure(movie_matcher: MovieMatcher) -> None:
     mock_logger.error.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_fetch_movie_details_empty_response(movie_matcher: MovieMatcher) -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_fetch_movie_details_empty_response(
+    movie_matcher: MovieMatcher, http_client_mock: MagicMock
+) -> None:
     """Test _fetch_movie_details method when API returns empty data."""
     # Mock HTTP client to return None
-    http_client_mock = AsyncMock(spec=AsyncHttpClient)
-    http_client_mock.__aenter__.return_value = http_client_mock
-    http_client_mock.fetch_json = AsyncMock(return_value=None)
+    http_client_mock.fetch_json.return_value = None
 
     with patch.object(movie_matcher, "http_client", http_client_mock):
         result = await movie_matcher._fetch_movie_details(123)
@@ -194,78 +232,57 @@ async def test_fetch_movie_details_empty_response(movie_matcher: MovieMatcher) -
     assert result == {}
 
 
-def test_create_movie_dto_complete_data(
-    movie_matcher: MovieMatcher, mock_tmdb_data: Dict[str, Any]
-) -> None:
-    """Test _create_movie_dto method with complete data."""
-    result = movie_matcher._create_movie_dto(mock_tmdb_data)
-
-    # Assertions
-    assert isinstance(result, MovieDTO)
-    assert result.tmdb_id == mock_tmdb_data["id"]
-    assert result.title == mock_tmdb_data["title"]
-    assert result.overview == mock_tmdb_data["overview"]
-    assert result.poster_path == mock_tmdb_data["poster_path"]
-    assert result.backdrop_path == mock_tmdb_data["backdrop_path"]
-    assert result.release_date == date(2023, 1, 15)
-    assert result.year == 2023
-
-
-def test_create_movie_dto_missing_release_date(
-    movie_matcher: MovieMatcher, mock_tmdb_data: Dict[str, Any]
-) -> None:
-    """Test _create_movie_dto method with missing release date."""
-    # Remove release date from mock data
-    data_without_date = mock_tmdb_data.copy()
-    data_without_date.pop("release_date")
-
-    result = movie_matcher._create_movie_dto(data_without_date)
-
-    # Assertions
-    assert isinstance(result, MovieDTO)
-    assert result.release_date is None
-    assert result.year is None
-
-
-def test_create_movie_dto_invalid_release_date(
-    movie_matcher: MovieMatcher, mock_tmdb_data: Dict[str, Any]
+@pytest.mark.parametrize(
+    "movie_data, expected_release_date, expected_year",
+    [
+        (dict(_TMDB_MOVIE_DATA), date(2023, 1, 15), 2023),
+        (
+            {k: v for k, v in _TMDB_MOVIE_DATA.items() if k != "release_date"},
+            None,
+            None,
+        ),
+        ({**_TMDB_MOVIE_DATA, "release_date": "not-a-date"}, None, None),
+        (
+            {
+                "id": 123,
+                "title": "Test Movie",
+                "poster_path": "/path/to/poster.jpg",
+                "backdrop_path": "/path/to/backdrop.jpg",
+            },
+            None,
+            None,
+        ),
+    ],
+    ids=[
+        "complete_data",
+        "missing_release_date",
+        "invalid_release_date",
+        "minimal_data",
+    ],
+)
+def test_create_movie_dto(
+    movie_matcher: MovieMatcher,
+    movie_data: Dict[str, Any],
+    expected_release_date: Optional[date],
+    expected_year: Optional[int],
 ) -> None:
-    """Test _create_movie_dto method with invalid release date."""
-    # Set invalid release date in mock data
-    data_with_invalid_date = mock_tmdb_data.copy()
-    data_with_invalid_date["release_date"] = "not-a-date"
-
-    result = movie_matcher._create_movie_dto(data_with_invalid_date)
-
-    # Assertions
-    assert isinstance(result, MovieDTO)
-    assert result.release_date is None
-    assert result.year is None
-
-
-def test_create_movie_dto_minimal_data(movie_matcher: MovieMatcher) -> None:
-    """Test _create_movie_dto method with minimal required data."""
-    minimal_data = {
-        "id": 123,
-        "title": "Test Movie",
-        "poster_path": "/path/to/poster.jpg",
-        "backdrop_path": "/path/to/backdrop.jpg",
-    }
-
-    result = movie_matcher._create_movie_dto(minimal_data)
+    """Test _create_movie_dto method across complete, partial and invalid data."""
+    result = movie_matcher._create_movie_dto(movie_data)
 
     # Assertions
     assert isinstance(result, MovieDTO)
-    assert result.tmdb_id == minimal_data["id"]
-    assert result.title == minimal_data["title"]
-    assert result.overview is None
-    assert result.release_date is None
-    assert result.year is None
+    assert result.tmdb_id == movie_data["id"]
+    assert result.title == movie_data["title"]
+    assert result.overview == movie_data.get("overview")
+    assert result.poster_path == movie_data["poster_path"]
+    assert result.backdrop_path == movie_data["backdrop_path"]
+    assert result.release_date == expected_release_date
+    assert result.year == expected_year
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_find_pending_entity_not_found(
-    movie_matcher: MovieMatcher, mock_db_session: tuple[AsyncMock, AsyncMock]
+    movie_matcher: MovieMatcher, mock_db_session: tuple[MagicMock, MagicMock]
 ) -> None:
     """Test _find_pending_entity method when no entity is found."""
     session_factory, db_session = mock_db_session
@@ -275,7 +292,7 @@ async def test_find_pending_entity_not_found(
     mappings_result.first.return_value = None
     execution_result = AsyncMock()
     execution_result.mappings.return_value = mappings_result
-    db_session.execute = AsyncMock(return_value=execution_result)
+    db_session.execute.return_value = execution_result
 
     # Call the method
     result = await movie_matcher._find_pending_entity(123)
@@ -285,13 +302,13 @@ async def test_find_pending_entity_not_found(
     assert db_session.execute.call_count == 1
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_find_pending_entity_failure(
-    movie_matcher: MovieMatcher, mock_db_session: tuple[AsyncMock, AsyncMock]
+    movie_matcher: MovieMatcher, mock_db_session: tuple[MagicMock, MagicMock]
 ) -> None:
     """Test _find_pending_entity method when database operation fails."""
     session_factory, db_session = mock_db_session
-    db_session.execute = AsyncMock(side_effect=Exception("Database error"))
+    db_session.execute.side_effect = Exception("Database error")
 
     # Call the method
     result = await movie_matcher._find_pending_entity(123)
@@ -0,0 +1 @@
+# Empty init file to make tests/workers/tv_matcher a package
@@ -0,0 +1,162 @@
+"""Fixtures shared by the TV matcher test modules."""
+
+from logging import Logger
+from typing import Any, Dict, Generator, Mapping, cast
+from unittest.mock import AsyncMock, create_autospec, patch
+
+import pytest
+
+from src.common.db import AsyncDatabaseSession
+from src.common.dto import TVShowDTO, TvMatcherParams
+from src.workers.tv_matcher import TVMatcher
+from tests.workers.tv_matcher.helpers import FILE_ID, TMDB_TV_SHOW_DATA, LoggerStub
+
+
+@pytest.fixture(scope="session")
+def mock_logger() -> LoggerStub:
+    """Fixture for a stub logger shared by every test"""
+    return LoggerStub()
+
+
+# Autospeccing introspects the whole class, so the spec is built once and reset
+# before every test that uses it
+_DB_SESSION_SPEC = create_autospec(AsyncDatabaseSession, spec_set=True, instance=True)
+
+
+@pytest.fixture
+def inner_session() -> AsyncMock:
+    """Fixture for the session object yielded by mock_db_session's context manager
+
+    Tests only configure execute on it, so it is left unspecced; resetting an
+    AsyncSession autospec costs more than building a plain AsyncMock.
+    """
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_db_session(inner_session: AsyncMock) -> AsyncDatabaseSession:
+    """Fixture for a mocked database session"""
+    mock_session = _DB_SESSION_SPEC
+    mock_session.reset_mock(return_value=True, side_effect=True)
+
+    # Create a mock for the session context manager
+    mock_session_context = AsyncMock()
+    mock_session_context.__aenter__.return_value = inner_session
+    mock_session_context.__aexit__.return_value = None
+
+    # Create a proper async generator for get_session
+    async def mock_get_session():
+        yield mock_session_context
+
+    # Make get_session return our mock async generator
+    mock_session.get_session = mock_get_session
+
+    return mock_session
+
+
+@pytest.fixture(scope="module")
+def tv_matcher(mock_logger: LoggerStub) -> TVMatcher:
+    """Fixture for a TVMatcher shared by every test in the module
+
+    Tests stub its methods with monkeypatch.setattr, so a stub for a method the
+    class lacks fails loudly and pytest undoes it after the test.
+    """
+    with patch("src.workers.tv_matcher.AsyncHttpClient"):
+        matcher = TVMatcher(_DB_SESSION_SPEC, cast(Logger, mock_logger))
+
+    # Replace the HTTP client with our mock
+    matcher.http_client = AsyncMock()
+
+    return matcher
+
+
+@pytest.fixture(autouse=True)
+def reset_tv_matcher(
+    tv_matcher: TVMatcher, mock_db_session: AsyncDatabaseSession
+) -> Generator[None, None, None]:
+    """Restore the shared TVMatcher and clear its mocks after each test"""
+    initial_state = dict(vars(tv_matcher))
+    yield
+    vars(tv_matcher).clear()
+    vars(tv_matcher).update(initial_state)
+    cast(AsyncMock, tv_matcher.http_client).reset_mock(
+        return_value=True, side_effect=True
+    )
+    cast(LoggerStub, tv_matcher.logger).reset_mock()
+
+
+# This and the TMDB data fixtures below are built once per session; tests must
+# not mutate them
+@pytest.fixture(scope="session")
+def valid_params() -> TvMatcherParams:
+    """Fixture for valid TV matcher parameters"""
+    return TvMatcherParams(
+        tmdb_id=12345, season_number=1, episode_number=2, file_id=FILE_ID
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_tv_show_data() -> Mapping[str, Any]:
+    """Fixture for mock TV show data from TMDB"""
+    return TMDB_TV_SHOW_DATA
+
+
+@pytest.fixture(scope="session")
+def mock_season_data() -> Dict[str, Any]:
+    """Fixture for mock season data from TMDB"""
+    return {
+        "id": 67890,
+        "name": "Season 1",
+        "season_number": 1,
+        "overview": "Season 1 overview",
+        "poster_path": "/path/to/season_poster.jpg",
+        "air_date": "2020-01-01",
+        "episodes": [
+            {
+                "id": 111111,
+                "name": "Episode 1",
+                "episode_number": 1,
+                "overview": "Episode 1 overview",
+                "still_path": "/path/to/still1.jpg",
+                "air_date": "2020-01-01",
+            },
+            {
+                "id": 222222,
+                "name": "Episode 2",
+                "episode_number": 2,
+                "overview": "Episode 2 overview",
+                "still_path": "/path/to/still2.jpg",
+                "air_date": "2020-01-08",
+            },
+        ],
+    }
+
+
+@pytest.fixture(scope="session")
+def mock_episode_data() -> Dict[str, Any]:
+    """Fixture for mock episode data from TMDB"""
+    return {
+        "id": 222222,
+        "name": "Episode 2",
+        "episode_number": 2,
+        "season_number": 1,
+        "overview": "Episode 2 overview",
+        "still_path": "/path/to/still2.jpg",
+        "air_date": "2020-01-08",
+        "credits": {"cast": [], "crew": []},
+        "images": {"stills": []},
+        "videos": {"results": []},
+    }
+
+
+@pytest.fixture(scope="session")
+def sample_tv_show_dto() -> TVShowDTO:
+    """Fixture for a validated TV show DTO"""
+    return TVShowDTO(
+        tmdb_id=12345,
+        title="Test Show",
+        overview="Test overview",
+        poster_path="/path/to/poster.jpg",
+        backdrop_path="/path/to/backdrop.jpg",
+        year=2020,
+    )
@@ -0,0 +1,67 @@
+"""Shared constants and test doubles for the TV matcher tests."""
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+from unittest.mock import Mock
+from uuid import UUID
+
+# Fixed IDs keep failures reproducible; version=4 satisfies the DTOs' UUID4 checks
+SHOW_ID = UUID(int=1, version=4)
+SEASON_ID = UUID(int=2, version=4)
+EPISODE_ID = UUID(int=3, version=4)
+ENTITY_ID = UUID(int=4, version=4)
+FILE_ID = UUID(int=5, version=4)
+
+# Complete TMDB show payload; read-only
+TMDB_TV_SHOW_DATA: Mapping[str, Any] = MappingProxyType(
+    {
+        "id": 12345,
+        "name": "Test Show",
+        "overview": "This is a test show",
+        "poster_path": "/path/to/poster.jpg",
+        "backdrop_path": "/path/to/backdrop.jpg",
+        "first_air_date": "2020-01-01",
+        "seasons": [
+            {
+                "id": 67890,
+                "name": "Season 1",
+                "season_number": 1,
+                "episode_count": 10,
+                "overview": "Season 1 overview",
+                "poster_path": "/path/to/season_poster.jpg",
+                "air_date": "2020-01-01",
+            }
+        ],
+    }
+)
+
+
+@dataclass
+class TVSeasonStub:
+    """Stand-in for the TVSeason attributes TVMatcher reads"""
+
+    id: UUID
+    poster_path: Optional[str] = None
+
+
+@dataclass
+class TVEpisodeStub:
+    """Stand-in for the TVEpisode attributes TVMatcher reads"""
+
+    id: UUID
+    still_path: Optional[str] = None
+
+
+@dataclass
+class LoggerStub:
+    """Stand-in for the logger with only the methods TVMatcher calls"""
+
+    debug: Mock = field(default_factory=Mock)
+    info: Mock = field(default_factory=Mock)
+    warning: Mock = field(default_factory=Mock)
+    error: Mock = field(default_factory=Mock)
+
+    def reset_mock(self) -> None:
+        for method in (self.debug, self.info, self.warning, self.error):
+            method.reset_mock()
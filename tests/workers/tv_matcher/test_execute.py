@@ -0,0 +1,121 @@
+# pyright: reportProtectedMemberAccess=false
+from typing import Any, Dict, Mapping
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.common.dto import (
+    ChildJobRequest,
+    ImageDownloaderParams,
+    JobType,
+    TVShowDTO,
+    TvMatcherParams,
+)
+from src.workers.tv_matcher import TVMatcher
+from tests.workers.tv_matcher.helpers import (
+    ENTITY_ID,
+    EPISODE_ID,
+    SEASON_ID,
+    SHOW_ID,
+    TVEpisodeStub,
+    TVSeasonStub,
+)
+
+# Returned by the mocked _create_image_download_jobs; validated once at import
+_IMAGE_DOWNLOAD_JOB = ChildJobRequest(
+    job_type=JobType.IMAGE_DOWNLOADER,
+    params=ImageDownloaderParams(image_url="/path/to/poster.jpg", entity_id=ENTITY_ID),
+)
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_execute_success(
+    tv_matcher: TVMatcher,
+    monkeypatch: pytest.MonkeyPatch,
+    valid_params: TvMatcherParams,
+    mock_tv_show_data: Mapping[str, Any],
+    mock_season_data: Dict[str, Any],
+    mock_episode_data: Dict[str, Any],
+    sample_tv_show_dto: TVShowDTO,
+) -> None:
+    """Test successful execution of the worker"""
+    # Setup
+    tv_show_id = SHOW_ID
+    entity_id = ENTITY_ID
+
+    # Create mock season and episode
+    mock_season = TVSeasonStub(id=SEASON_ID, poster_path="/path/to/season_poster.jpg")
+
+    mock_episode = TVEpisodeStub(id=EPISODE_ID, still_path="/path/to/episode_still.jpg")
+
+    # Mock every step execute() delegates to
+    monkeypatch.setattr(
+        tv_matcher, "_validate_parameters", Mock(return_value=valid_params)
+    )
+    monkeypatch.setattr(
+        tv_matcher,
+        "_process_tv_show",
+        AsyncMock(return_value=(sample_tv_show_dto, tv_show_id, mock_tv_show_data)),
+    )
+    monkeypatch.setattr(
+        tv_matcher, "_process_all_seasons_and_episodes", AsyncMock(return_value=True)
+    )
+    monkeypatch.setattr(
+        tv_matcher,
+        "_process_target_episode",
+        AsyncMock(return_value=(entity_id, mock_season, mock_episode)),
+    )
+    monkeypatch.setattr(
+        tv_matcher,
+        "_create_image_download_jobs",
+        Mock(return_value=[_IMAGE_DOWNLOAD_JOB]),
+    )
+
+    # Call the method
+    result = await tv_matcher.execute(valid_params)
+
+    # Verify results
+    assert isinstance(result, list)
+    assert len(result) == 1
+    assert isinstance(result[0], ChildJobRequest)
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_execute_invalid_parameters(
+    tv_matcher: TVMatcher, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test execution with invalid parameters"""
+    # Mock the validate_parameters method to raise ValueError
+    monkeypatch.setattr(
+        tv_matcher,
+        "_validate_parameters",
+        Mock(side_effect=ValueError("Parameters must be of type TvMatcherParams")),
+    )
+
+    # Call the method with an invalid parameter (not None)
+    invalid_params = {"tmdb_id": 12345}  # Not a TvMatcherParams object
+
+    # The execute method should handle the ValueError internally and return an empty list
+    result = await tv_matcher.execute(invalid_params)  # type: ignore
+
+    # Verify results
+    assert isinstance(result, list)
+    assert len(result) == 0
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_execute_with_no_parameters(
+    tv_matcher: TVMatcher, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test execution with no parameters"""
+    # Mock the validate_parameters method to handle None parameters
+    mock_validate = Mock(return_value=None)
+    monkeypatch.setattr(tv_matcher, "_validate_parameters", mock_validate)
+
+    # Call the method with None
+    result = await tv_matcher.execute(None)
+
+    # Verify results
+    assert isinstance(result, list)
+    assert len(result) == 0
+    mock_validate.assert_called_once_with(None)
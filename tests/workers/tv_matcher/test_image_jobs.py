@@ -0,0 +1,72 @@
+# pyright: reportProtectedMemberAccess=false
+from src.common.dto import ChildJobRequest, ImageDownloaderParams, JobType, TVShowDTO
+from src.workers.tv_matcher import TVMatcher
+from tests.workers.tv_matcher.helpers import (
+    ENTITY_ID,
+    EPISODE_ID,
+    SEASON_ID,
+    TVEpisodeStub,
+    TVSeasonStub,
+)
+
+
+def test_create_image_download_jobs(
+    tv_matcher: TVMatcher, sample_tv_show_dto: TVShowDTO
+) -> None:
+    """Test creation of image download jobs"""
+    # Setup
+    entity_id = ENTITY_ID
+
+    # Create test data with all image paths
+    target_season = TVSeasonStub(id=SEASON_ID, poster_path="/path/to/season_poster.jpg")
+
+    target_episode = TVEpisodeStub(
+        id=EPISODE_ID, still_path="/path/to/episode_still.jpg"
+    )
+
+    # Call the method
+    result = tv_matcher._create_image_download_jobs(
+        entity_id, sample_tv_show_dto, target_season, target_episode
+    )
+
+    # Verify results
+    assert isinstance(result, list)
+    assert (
+        len(result) == 4
+    )  # Should have 4 jobs (show poster, backdrop, season poster, episode still)
+
+    # Verify all jobs are of the correct type
+    for job in result:
+        assert isinstance(job, ChildJobRequest)
+        assert job.job_type == JobType.IMAGE_DOWNLOADER
+        assert isinstance(job.params, ImageDownloaderParams)
+        assert job.params.entity_id == entity_id
+
+
+def test_create_image_download_jobs_missing_images(tv_matcher: TVMatcher) -> None:
+    """Test creation of image download jobs with missing image paths"""
+    # Setup
+    entity_id = ENTITY_ID
+
+    # Create test data with missing image paths
+    tv_show_dto = TVShowDTO(
+        tmdb_id=12345,
+        title="Test Show",
+        overview="Test overview",
+        poster_path=None,  # Missing poster
+        backdrop_path=None,  # Missing backdrop
+        year=2020,
+    )
+
+    target_season = TVSeasonStub(id=SEASON_ID, poster_path=None)  # Missing poster
+
+    target_episode = TVEpisodeStub(id=EPISODE_ID, still_path=None)  # Missing still
+
+    # Call the method
+    result = tv_matcher._create_image_download_jobs(
+        entity_id, tv_show_dto, target_season, target_episode
+    )
+
+    # Verify results
+    assert isinstance(result, list)
+    assert len(result) == 0  # Should have no jobs since all image paths are missing
@@ -0,0 +1,124 @@
+# pyright: reportProtectedMemberAccess=false
+from typing import Any, Dict, Optional
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.common.dto import TVShowDTO
+from src.workers.tv_matcher import TVMatcher
+from tests.workers.tv_matcher.helpers import (
+    ENTITY_ID,
+    EPISODE_ID,
+    FILE_ID,
+    SEASON_ID,
+    SHOW_ID,
+    TVEpisodeStub,
+    TVSeasonStub,
+)
+
+
+# The steps _process_target_episode runs, in order
+_TARGET_EPISODE_STEPS = (
+    "_fetch_season_details",
+    "_find_target_season_and_episode",
+    "_fetch_episode_details",
+    "_create_episode_entity",
+)
+
+
+@pytest.mark.parametrize(
+    "failing_step, failure_value, logs_error",
+    [
+        (None, None, False),
+        ("_fetch_season_details", {}, True),
+        ("_find_target_season_and_episode", None, False),
+        ("_create_episode_entity", None, False),
+    ],
+    ids=[
+        "success",
+        "fetch_season_failure",
+        "find_target_failure",
+        "create_entity_failure",
+    ],
+)
+@pytest.mark.asyncio(loop_scope="module")
+async def test_process_target_episode(
+    tv_matcher: TVMatcher,
+    monkeypatch: pytest.MonkeyPatch,
+    mock_season_data: Dict[str, Any],
+    mock_episode_data: Dict[str, Any],
+    sample_tv_show_dto: TVShowDTO,
+    failing_step: Optional[str],
+    failure_value: Any,
+    logs_error: bool,
+) -> None:
+    """Test process_target_episode when every step succeeds or one step fails"""
+    # Setup
+    tmdb_id = 12345
+    season_number = 1
+    episode_number = 2
+    tv_show_id = SHOW_ID
+    file_id = FILE_ID
+    entity_id = ENTITY_ID
+
+    # Create mock season and episode
+    mock_season = TVSeasonStub(id=SEASON_ID)
+    mock_episode = TVEpisodeStub(id=EPISODE_ID)
+
+    # Mock every step, then make the failing one return its failure value
+    mocks = {
+        "_fetch_season_details": AsyncMock(return_value=mock_season_data),
+        "_find_target_season_and_episode": AsyncMock(
+            return_value=(mock_season, mock_episode, file_id)
+        ),
+        "_fetch_episode_details": AsyncMock(return_value=mock_episode_data),
+        "_create_episode_entity": AsyncMock(return_value=entity_id),
+    }
+    if failing_step is not None:
+        mocks[failing_step].return_value = failure_value
+    for step, mock in mocks.items():
+        monkeypatch.setattr(tv_matcher, step, mock)
+
+    # Call the method
+    result = await tv_matcher._process_target_episode(
+        tmdb_id,
+        season_number,
+        episode_number,
+        tv_show_id,
+        sample_tv_show_dto,
+        file_id,
+    )
+
+    # Verify results
+    if failing_step is None:
+        assert result is not None
+        result_entity_id, result_season, result_episode = result
+        assert result_entity_id == entity_id
+        assert result_season is mock_season
+        assert result_episode is mock_episode
+        called_steps = len(_TARGET_EPISODE_STEPS)
+    else:
+        assert result is None
+        called_steps = _TARGET_EPISODE_STEPS.index(failing_step) + 1
+
+    # Verify the steps up to the failing one ran once and the rest never ran
+    expected_args = {
+        "_fetch_season_details": (tmdb_id, season_number),
+        "_find_target_season_and_episode": (
+            tv_show_id,
+            season_number,
+            episode_number,
+            file_id,
+        ),
+        "_fetch_episode_details": (tmdb_id, season_number, episode_number),
+    }
+    for step in _TARGET_EPISODE_STEPS[:called_steps]:
+        if step in expected_args:
+            mocks[step].assert_called_once_with(*expected_args[step])
+        else:
+            mocks[step].assert_called_once()
+    for step in _TARGET_EPISODE_STEPS[called_steps:]:
+        mocks[step].assert_not_called()
+
+    if logs_error:
+        tv_matcher.logger.error.assert_called_once()